@@ -1,18 +1,30 @@
 // The module 'vscode' contains the VS Code extensibility API
 // Import the module and reference it with the alias vscode in your code below
 import * as vscode from 'vscode';
-import { get_encoding } from 'tiktoken';
+import { get_encoding, Tiktoken } from 'tiktoken';
+
+// Shared cl100k_base encoder, created on first use and released on deactivate
+let sharedEncoding: Tiktoken | undefined;
+
+function getSharedEncoding(): Tiktoken {
+	if (!sharedEncoding) {
+		// cl100k_base is the encoding used by GPT-4, GPT-3.5-turbo
+		sharedEncoding = get_encoding('cl100k_base');
+	}
+	return sharedEncoding;
+}
 
 // This method is called when your extension is activated
 // Your extension is activated the very first time the command is executed
 export function activate(context: vscode.ExtensionContext) {
 
-	// Use the console to output diagnostic information (console.log) and errors (console.error)
-	// This line of code will only be executed once when your extension is activated
-	console.log('Congratulations, your extension "mttc" is now active!');
+	// Diagnostics go to a log output channel, which VS Code buffers and writes off the extension host's hot path
+	const log = vscode.window.createOutputChannel('MCP Tools Token Counter', { log: true });
+	context.subscriptions.push(log);
+	log.info('Extension "mttc" is now active');
 
 	// Register the webview view provider
-	const provider = new tokenCounteViewProvider();
+	const provider = new tokenCounteViewProvider(log);
 	context.subscriptions.push(
 		vscode.window.registerWebviewViewProvider('tokenCounteView.content', provider)
 	);
@@ -27,14 +39,13 @@ export function activate(context: vscode.ExtensionContext) {
 
 class tokenCounteViewProvider implements vscode.WebviewViewProvider {
 	private _view?: vscode.WebviewView;
-	private _encoding: any;
 	private readonly _expandedGroups = new Set<string>();
 	private _filterTerm = '';
+	private _toolGroups?: ToolGroup[];
+	private _lastFilter?: { term: string; source: ToolGroup[]; result: ToolGroup[] };
+	private _tokenCounts = new Map<string, number>();
 
-	constructor() {
-		// Initialize tiktoken with cl100k_base encoding (used by GPT-4, GPT-3.5-turbo)
-		this._encoding = get_encoding('cl100k_base');
-	}
+	constructor(private readonly _log: vscode.LogOutputChannel) {}
 
 	public resolveWebviewView(
 		webviewView: vscode.WebviewView,
@@ -50,26 +61,16 @@ class tokenCounteViewProvider implements vscode.WebviewViewProvider {
 		webviewView.webview.html = this.getWebviewContent();
 
 		// Handle messages from the webview
-		webviewView.webview.onDidReceiveMessage((message) => {
+		const messageListener = webviewView.webview.onDidReceiveMessage((message) => {
 			switch (message.command) {
 				case 'refresh':
-					webviewView.webview.html = this.getWebviewContent();
+					this.getToolGroups(true);
+					this.postContentUpdate(webviewView);
 					break;
 				case 'filter':
 					if (typeof message.value === 'string') {
 						this._filterTerm = message.value;
-						const groups = this.getToolGroups();
-						const filteredGroups = this.applyFilter(groups);
-						const totals = this.getGlobalTotals(filteredGroups);
-						const overallTotals = this.getGlobalTotals(groups);
-						const isFiltered = this._filterTerm.trim().length > 0;
-						webviewView.webview.postMessage({
-							command: 'updateContent',
-							groups: filteredGroups.map(g => this.serializeGroup(g)),
-							totals,
-							overallTotals,
-							isFiltered
-						});
+						this.postContentUpdate(webviewView);
 					}
 					break;
 				case 'expand':
@@ -86,14 +87,49 @@ class tokenCounteViewProvider implements vscode.WebviewViewProvider {
 					break;
 			}
 		});
+
+		// Without retainContextWhenHidden VS Code restores a re-shown view from the last html string,
+		// which refresh/filter updates never touch, so re-render from the current state
+		const visibilityListener = webviewView.onDidChangeVisibility(() => {
+			if (webviewView.visible) {
+				webviewView.webview.html = this.getWebviewContent();
+			}
+		});
+
+		// Tear down with the view so a hidden/closed sidebar holds no listener or tool snapshot
+		webviewView.onDidDispose(() => {
+			messageListener.dispose();
+			visibilityListener.dispose();
+			this._view = undefined;
+			this._toolGroups = undefined;
+			this._lastFilter = undefined;
+			this._tokenCounts.clear();
+		});
 	}
 
-	private getWebviewContent(): string {
-		const groups = this.getToolGroups();
+	private postContentUpdate(view: vscode.WebviewView): void {
+		// Patch the existing document in place instead of reloading the whole webview
+		const { filteredGroups, isFiltered, totals, overallTotals } = this.computeViewModel(this.getToolGroups());
+		view.webview.postMessage({
+			command: 'updateContent',
+			groups: filteredGroups.map(g => this.serializeGroup(g)),
+			totals,
+			overallTotals,
+			isFiltered
+		});
+	}
+
+	private computeViewModel(groups: ToolGroup[]) {
 		const filteredGroups = this.applyFilter(groups);
-		const totals = this.getGlobalTotals(filteredGroups);
-		const overallTotals = this.getGlobalTotals(groups);
 		const isFiltered = this._filterTerm.trim().length > 0;
+		const totals = this.getGlobalTotals(filteredGroups);
+		// Unfiltered views show the same numbers twice; only total the full list when it differs
+		const overallTotals = isFiltered ? this.getGlobalTotals(groups) : totals;
+		return { filteredGroups, isFiltered, totals, overallTotals };
+	}
+
+	private getWebviewContent(): string {
+		const { filteredGroups, isFiltered, totals, overallTotals } = this.computeViewModel(this.getToolGroups(true));
 		let serversHtml = '';
 
 		if (filteredGroups.length === 0) {
@@ -142,212 +178,7 @@ class tokenCounteViewProvider implements vscode.WebviewViewProvider {
 			<meta name="viewport" content="width=device-width, initial-scale=1.0">
 			<title>MCP Servers & Tools</title>
 			<style>
-				body {
-					padding: 10px;
-					margin: 0;
-					font-family: var(--vscode-font-family);
-					font-size: var(--vscode-font-size);
-					color: var(--vscode-foreground);
-					background-color: var(--vscode-editor-background);
-				}
-				.summary {
-					display: flex;
-					gap: 12px;
-					font-size: 12px;
-					color: var(--vscode-descriptionForeground);
-					margin-bottom: 12px;
-					flex-wrap: wrap;
-				}
-				.filter-indicator {
-					color: var(--vscode-textLink-foreground);
-				}
-				.header {
-					display: flex;
-					align-items: center;
-					justify-content: space-between;
-					margin-bottom: 16px;
-					padding-bottom: 10px;
-					border-bottom: 1px solid var(--vscode-panel-border);
-				}
-				h2 {
-					margin: 0;
-					color: var(--vscode-foreground);
-					font-size: 14px;
-					font-weight: 600;
-					letter-spacing: 0.3px;
-					text-transform: uppercase;
-				}
-				.refresh-btn {
-					background: transparent;
-					color: var(--vscode-foreground);
-					border: 1px solid var(--vscode-panel-border);
-					padding: 4px 8px;
-					cursor: pointer;
-					border-radius: 3px;
-					font-size: 11px;
-					display: flex;
-					align-items: center;
-					gap: 4px;
-					transition: all 0.2s;
-				}
-				.refresh-btn:hover {
-					background: var(--vscode-list-hoverBackground);
-					border-color: var(--vscode-focusBorder);
-				}
-				.refresh-icon {
-					font-size: 12px;
-				}
-				.server {
-					margin-bottom: 12px;
-					border: 1px solid var(--vscode-panel-border);
-					border-radius: 4px;
-					padding: 14px;
-					background: var(--vscode-editor-background);
-					transition: background 0.2s;
-				}
-				.server:hover {
-					background: var(--vscode-list-hoverBackground);
-				}
-				.server-header {
-					display: flex;
-					justify-content: space-between;
-					align-items: flex-start;
-					margin-bottom: 8px;
-				}
-				.server-name {
-					color: var(--vscode-textLink-foreground);
-					font-size: 15px;
-					font-weight: 600;
-				}
-				.server-id {
-					font-size: 11px;
-					color: var(--vscode-descriptionForeground);
-				}
-				.server-stats {
-					display: flex;
-					gap: 15px;
-					flex-wrap: wrap;
-				}
-				.stat {
-					color: var(--vscode-descriptionForeground);
-					font-size: 13px;
-					background: var(--vscode-editorWidget-background);
-					padding: 4px 8px;
-					border-radius: 3px;
-				}
-				.badge {
-					font-size: 11px;
-					padding: 2px 8px;
-					border-radius: 999px;
-					text-transform: uppercase;
-					letter-spacing: 0.3px;
-					border: 1px solid var(--vscode-panel-border);
-					color: var(--vscode-descriptionForeground);
-				}
-				.badge.mcp {
-					color: var(--vscode-testing-iconPassed);
-					border-color: var(--vscode-testing-iconPassed);
-				}
-				.badge.extension {
-					color: var(--vscode-focusBorder);
-					border-color: var(--vscode-focusBorder);
-				}
-				.badge.builtin {
-					color: var(--vscode-descriptionForeground);
-				}
-				.tool-list {
-					margin-top: 10px;
-					display: flex;
-					flex-direction: column;
-					gap: 8px;
-				}
-				.tool-list--collapsed {
-					gap: 6px;
-				}
-				.tool-preview {
-					display: flex;
-					flex-wrap: wrap;
-					gap: 6px;
-					font-size: 12px;
-					color: var(--vscode-descriptionForeground);
-				}
-				.tool-chip {
-					background: var(--vscode-editorWidget-background);
-					border-radius: 999px;
-					padding: 2px 8px;
-					font-size: 11px;
-					color: var(--vscode-descriptionForeground);
-				}
-				.tool-row {
-					display: flex;
-					justify-content: space-between;
-					gap: 12px;
-					padding-bottom: 6px;
-					border-bottom: 1px solid var(--vscode-panel-border);
-				}
-				.tool-row:last-child {
-					border-bottom: none;
-					padding-bottom: 0;
-				}
-				.tool-name {
-					font-weight: 600;
-				}
-				.tool-description {
-					font-size: 12px;
-					color: var(--vscode-descriptionForeground);
-				}
-				.tool-meta {
-					font-size: 12px;
-					color: var(--vscode-descriptionForeground);
-					white-space: nowrap;
-				}
-				.tool-extra {
-					text-align: right;
-					font-size: 12px;
-					color: var(--vscode-descriptionForeground);
-				}
-				.link-button {
-					background: none;
-					border: none;
-					color: var(--vscode-textLink-foreground);
-					cursor: pointer;
-					font-size: 12px;
-					padding: 0;
-					text-decoration: underline;
-				}
-				.link-button:focus {
-					outline: 1px solid var(--vscode-focusBorder);
-				}
-				.no-tools {
-					color: var(--vscode-descriptionForeground);
-					font-style: italic;
-					text-align: center;
-					padding: 20px;
-				}
-				.filter-bar {
-					display: flex;
-					gap: 8px;
-					margin-bottom: 12px;
-				}
-				.filter-input {
-					flex: 1;
-					padding: 6px 8px;
-					border-radius: 4px;
-					border: 1px solid var(--vscode-panel-border);
-					background: var(--vscode-input-background);
-					color: var(--vscode-input-foreground);
-				}
-				.clear-filter {
-					border: none;
-					background: var(--vscode-button-secondaryBackground);
-					color: var(--vscode-button-secondaryForeground);
-					padding: 6px 10px;
-					border-radius: 4px;
-					cursor: pointer;
-				}
-				.clear-filter:hover {
-					background: var(--vscode-button-secondaryHoverBackground);
-				}
+				${WEBVIEW_STYLES}
 			</style>
 		</head>
 		<body>
@@ -368,176 +199,9 @@ class tokenCounteViewProvider implements vscode.WebviewViewProvider {
 				<input class="filter-input" type="search" placeholder="Filter servers or tools" value="${filterValue}" oninput="onFilterChange(event)">
 				${isFiltered ? '<button class="clear-filter" onclick="clearFilter()">Clear</button>' : ''}
 			</div>
-			${serversHtml}
+			<div class="servers">${serversHtml}</div>
 			<script>
-				const vscode = acquireVsCodeApi();
-				function refresh() {
-					vscode.postMessage({ command: 'refresh' });
-				}
-				function toggleGroup(key, expanded) {
-					vscode.postMessage({ command: expanded ? 'collapse' : 'expand', key });
-				}
-				function onFilterChange(event) {
-					vscode.postMessage({ command: 'filter', value: event.target.value || '' });
-				}
-				function clearFilter() {
-					vscode.postMessage({ command: 'filter', value: '' });
-				}
-				document.addEventListener('click', (event) => {
-					const target = event.target;
-					if (target && target instanceof HTMLElement && target.dataset.action === 'toggle-tools') {
-						const key = target.dataset.key;
-						if (key) {
-							const expanded = target.dataset.state === 'expanded';
-							toggleGroup(key, expanded);
-						}
-					}
-				});
-				function escapeHtml(unsafe) {
-					return unsafe
-						.replace(/&/g, "&amp;")
-						.replace(/</g, "&lt;")
-						.replace(/>/g, "&gt;")
-						.replace(/"/g, "&quot;")
-						.replace(/'/g, "&#039;");
-				}
-
-				function renderClassificationLabel(kind) {
-					switch (kind) {
-						case 'mcp': return 'MCP Server';
-						case 'extension': return 'Extension Tool';
-						case 'builtin': return 'Built-In';
-						default: return 'Tool Source';
-					}
-				}
-
-				function renderToolList(group) {
-					if (group.tools.length === 0) {
-						return '<div class="tool-list"><p class="no-tools">No tools registered.</p></div>';
-					}
-
-					if (!group.expanded) {
-						const preview = group.tools.slice(0, 3).map(tool => 
-							'<span class="tool-chip">' + escapeHtml(tool.shortName) + '</span>'
-						).join('');
-						return '<div class="tool-list tool-list--collapsed">' +
-							'<div class="tool-preview">' + (preview || 'Tools unavailable') + '</div>' +
-							'<button class="link-button" data-action="toggle-tools" data-state="collapsed" data-key="' + group.key + '">' +
-							'View all ' + group.toolCount + ' tool' + (group.toolCount !== 1 ? 's' : '') + '</button></div>';
-					}
-
-					const preview = group.tools.map(tool => 
-						'<div class="tool-row">' +
-						'<div><div class="tool-name">' + escapeHtml(tool.shortName) + '</div>' +
-						'<div class="tool-description">' + escapeHtml(tool.description || 'No description provided') + '</div></div>' +
-						'<span class="tool-meta">' + tool.tokenCount.toLocaleString() + ' tokens</span></div>'
-					).join('');
-
-					const footer = '<div class="tool-extra">' +
-						'<button class="link-button" data-action="toggle-tools" data-state="expanded" data-key="' + group.key + '">Show less</button></div>';
-
-					return '<div class="tool-list">' + preview + footer + '</div>';
-				}
-
-				function updateContentWithoutReload(data) {
-					const { groups, totals, overallTotals, isFiltered } = data;
-					const filterInput = document.querySelector('.filter-input');
-					const filterValue = filterInput ? filterInput.value : '';
-					
-					const sourceSummary = isFiltered
-						? totals.servers + '/' + overallTotals.servers + ' sources'
-						: totals.servers + ' ' + (totals.servers === 1 ? 'source' : 'sources');
-					const toolSummary = isFiltered
-						? totals.tools + '/' + overallTotals.tools + ' tools'
-						: totals.tools + ' total tools';
-					const tokenSummary = isFiltered
-						? totals.tokens.toLocaleString() + '/' + overallTotals.tokens.toLocaleString() + ' tokens'
-						: totals.tokens.toLocaleString() + ' tokens across all descriptions';
-					const filterIndicator = isFiltered ? '<span class="filter-indicator">Filter: "' + escapeHtml(filterValue) + '"</span>' : '';
-
-					const summary = document.querySelector('.summary');
-					if (summary) {
-						summary.innerHTML = 
-							'<span>🧩 ' + sourceSummary + '</span>' +
-							'<span>🔧 ' + toolSummary + '</span>' +
-							'<span>🎫 ' + tokenSummary + '</span>' +
-							filterIndicator;
-					}
-
-					const filterBar = document.querySelector('.filter-bar');
-					if (filterBar) {
-						const clearBtn = filterBar.querySelector('.clear-filter');
-						if (isFiltered && !clearBtn) {
-							const btn = document.createElement('button');
-							btn.className = 'clear-filter';
-							btn.textContent = 'Clear';
-							btn.onclick = clearFilter;
-							filterBar.appendChild(btn);
-						} else if (!isFiltered && clearBtn) {
-							clearBtn.remove();
-						}
-					}
-
-					const filterBarEl = document.querySelector('.filter-bar');
-					if (!filterBarEl) return;
-
-					let serversHtml = '';
-					if (groups.length === 0) {
-						const message = isFiltered
-							? 'No MCP servers or tools match your filter.'
-							: 'No MCP servers or tools found.';
-						serversHtml = '<p class="no-tools">' + message + '</p>';
-					} else {
-						for (const group of groups) {
-							serversHtml += 
-								'<div class="server ' + group.classification + '" data-group="' + group.key + '">' +
-								'<div class="server-header"><div>' +
-								'<div class="server-name">📦 ' + escapeHtml(group.label) + '</div>' +
-								(group.id && group.id !== group.label ? '<div class="server-id">' + escapeHtml(group.id) + '</div>' : '') +
-								'</div>' +
-								'<span class="badge ' + group.classification + '">' + renderClassificationLabel(group.classification) + '</span>' +
-								'</div>' +
-								'<div class="server-stats">' +
-								'<span class="stat">🔧 ' + group.toolCount + ' tool' + (group.toolCount !== 1 ? 's' : '') + '</span>' +
-								'<span class="stat">🎫 ' + group.tokenCount.toLocaleString() + ' tokens</span>' +
-								'</div>' +
-								renderToolList(group) +
-								'</div>';
-						}
-					}
-
-					const existingServers = document.querySelectorAll('.server');
-					const existingNoTools = document.querySelector('p.no-tools');
-					
-					if (existingServers.length > 0) {
-						existingServers.forEach(el => el.remove());
-					}
-					if (existingNoTools) {
-						existingNoTools.remove();
-					}
-
-					filterBarEl.insertAdjacentHTML('afterend', serversHtml);
-				}
-
-				window.addEventListener('message', (event) => {
-					const message = event.data;
-					if (!message || typeof message !== 'object') {
-						return;
-					}
-					if (message.command === 'updateTools') {
-						const section = document.querySelector('.server[data-group="' + message.key + '"]');
-						if (!section) {
-							return;
-						}
-						const list = section.querySelector('.tool-list');
-						if (!list) {
-							return;
-						}
-						list.innerHTML = message.html;
-					} else if (message.command === 'updateContent') {
-						updateContentWithoutReload(message);
-					}
-				});
+				${WEBVIEW_SCRIPT}
 			</script>
 		</body>
 		</html>`;
@@ -558,7 +222,7 @@ class tokenCounteViewProvider implements vscode.WebviewViewProvider {
 		}
 
 		if (!expanded) {
-			const preview = group.tools.slice(0, 3).map(tool => `<span class="tool-chip">${this.escapeHtml(tool.shortName)}</span>`).join('');
+			const preview = group.tools.slice(0, COLLAPSED_PREVIEW_COUNT).map(tool => `<span class="tool-chip">${this.escapeHtml(tool.shortName)}</span>`).join('');
 			return `
 				<div class="tool-list tool-list--collapsed">
 					<div class="tool-preview">${preview || 'Tools unavailable'}</div>
@@ -608,13 +272,31 @@ class tokenCounteViewProvider implements vscode.WebviewViewProvider {
 		}, { servers: 0, tools: 0, tokens: 0 });
 	}
 
-	private getToolGroups(): ToolGroup[] {
+	private getToolGroups(rebuild = false): ToolGroup[] {
+		// Reuse the last snapshot for filter/expand/collapse; only a full render re-reads the tools
+		if (rebuild || !this._toolGroups) {
+			this._toolGroups = this.buildToolGroups();
+			this._log.debug(`Rebuilt ${this._toolGroups.length} tool groups`);
+		}
+		return this._toolGroups;
+	}
+
+	private buildToolGroups(): ToolGroup[] {
+		// Carry counts over only for descriptions still present, so edited or removed ones are dropped
+		const previousCounts = this._tokenCounts;
+		this._tokenCounts = new Map<string, number>();
 		const toolMap = new Map<string, ToolGroup>();
 		for (const tool of vscode.lm.tools) {
 			const source = this.resolveToolSource(tool);
-			const enriched = this.enrichTool(tool);
+			const enriched = this.enrichTool(tool, previousCounts);
 			const key = source.id.toLowerCase();
-			const entry = toolMap.get(key) ?? { ...source, tools: [], tokenCount: 0, key };
+			const entry = toolMap.get(key) ?? {
+				...source,
+				tools: [],
+				tokenCount: 0,
+				key,
+				searchText: `${source.label}\n${source.id}`.toLowerCase()
+			};
 			entry.tools.push(enriched);
 			entry.tokenCount += enriched.tokenCount;
 			toolMap.set(key, entry);
@@ -623,7 +305,7 @@ class tokenCounteViewProvider implements vscode.WebviewViewProvider {
 		return Array.from(toolMap.values())
 			.sort((a, b) => {
 				if (a.classification !== b.classification) {
-					return this.classificationOrder(a.classification) - this.classificationOrder(b.classification);
+					return CLASSIFICATION_ORDER[a.classification] - CLASSIFICATION_ORDER[b.classification];
 				}
 				if (b.tools.length !== a.tools.length) {
 					return b.tools.length - a.tools.length;
@@ -641,15 +323,17 @@ class tokenCounteViewProvider implements vscode.WebviewViewProvider {
 			return groups;
 		}
 
-		return groups.filter(group => {
-			const labelMatch = group.label.toLowerCase().includes(term) || group.id.toLowerCase().includes(term);
-			if (labelMatch) {
-				return true;
-			}
-			return group.tools.some(tool =>
-				tool.shortName.toLowerCase().includes(term) || (tool.description ?? '').toLowerCase().includes(term)
-			);
-		});
+		// Typing usually extends the previous term, and anything matching the longer term also matched
+		// the shorter one, so narrow the previous result instead of rescanning the whole snapshot
+		const last = this._lastFilter;
+		const candidates = last && last.source === groups && term.includes(last.term) ? last.result : groups;
+
+		// Search text is lowercased once per snapshot, so each keystroke only does substring checks
+		const result = candidates.filter(group =>
+			group.searchText.includes(term) || group.tools.some(tool => tool.searchText.includes(term))
+		);
+		this._lastFilter = { term, source: groups, result };
+		return result;
 	}
 
 	private expandGroup(view: vscode.WebviewView, key: string): void {
@@ -676,16 +360,29 @@ class tokenCounteViewProvider implements vscode.WebviewViewProvider {
 		return this.getToolGroups().find(group => group.key === key);
 	}
 
-	private enrichTool(tool: vscode.LanguageModelToolInformation): EnrichedTool {
-		const tokenCount = tool.description ? this._encoding.encode(tool.description).length : 0;
+	private enrichTool(tool: vscode.LanguageModelToolInformation, previousCounts: ReadonlyMap<string, number>): EnrichedTool {
+		const tokenCount = tool.description ? this.countTokens(tool.description, previousCounts) : 0;
+		const shortName = this.humanizeToolName(tool.name);
+		const description = tool.description ?? '';
 		return {
-			info: tool,
 			tokenCount,
-			shortName: this.humanizeToolName(tool.name),
-			description: tool.description ?? ''
+			shortName,
+			description,
+			searchText: `${shortName}\n${description}`.toLowerCase()
 		};
 	}
 
+	private countTokens(text: string, previousCounts: ReadonlyMap<string, number>): number {
+		// Tool descriptions rarely change between refreshes, so only encode unseen text
+		let count = this._tokenCounts.get(text) ?? previousCounts.get(text);
+		if (count === undefined) {
+			// Descriptions are plain text: skip the special-token scan (and its throw on e.g. "<|endoftext|>")
+			count = getSharedEncoding().encode_ordinary(text).length;
+		}
+		this._tokenCounts.set(text, count);
+		return count;
+	}
+
 	private resolveToolSource(tool: vscode.LanguageModelToolInformation): ToolGroupInfo {
 		const fromTags = this.extractSourceFromTags(tool.tags ?? []);
 		if (fromTags) {
@@ -705,15 +402,12 @@ class tokenCounteViewProvider implements vscode.WebviewViewProvider {
 			if (!value) {
 				continue;
 			}
-			if (lowerKey === 'server' || lowerKey === 'mcp') {
-				return this.createGroupInfo(value, 'mcp');
-			}
-			if (lowerKey === 'extension' || lowerKey === 'ext') {
-				return this.createGroupInfo(value, 'extension');
+			const classification = TAG_KEY_CLASSIFICATIONS.get(lowerKey);
+			if (classification) {
+				return this.createGroupInfo(value, classification);
 			}
 			if (lowerKey === 'source') {
-				const classification = value.toLowerCase().includes('mcp') ? 'mcp' : 'extension';
-				return this.createGroupInfo(value, classification);
+				return this.createGroupInfo(value, this.classifyPrefix(value));
 			}
 		}
 		return undefined;
@@ -770,14 +464,8 @@ class tokenCounteViewProvider implements vscode.WebviewViewProvider {
 	}
 
 	private classifyPrefix(prefix: string): ToolGroupClassification {
-		const lower = prefix.toLowerCase();
-		if (lower.includes('mcp')) {
-			return 'mcp';
-		}
-		if (lower.includes('copilot') || lower.includes('github') || lower.includes('extension')) {
-			return 'extension';
-		}
-		return 'extension';
+		// Anything not named like an MCP server (copilot, github, other extensions) is an extension tool
+		return prefix.toLowerCase().includes('mcp') ? 'mcp' : 'extension';
 	}
 
 	private createGroupInfo(raw: string, classification: ToolGroupClassification): ToolGroupInfo {
@@ -802,20 +490,10 @@ class tokenCounteViewProvider implements vscode.WebviewViewProvider {
 			.join(' ');
 	}
 
-	private classificationOrder(kind: ToolGroupClassification): number {
-		switch (kind) {
-			case 'mcp':
-				return 0;
-			case 'extension':
-				return 1;
-			case 'builtin':
-				return 2;
-			default:
-				return 3;
-		}
-	}
-
 	private serializeGroup(group: ToolGroup): any {
+		// Collapsed groups only render a few chips, so don't ship every description to the webview
+		const expanded = this._expandedGroups.has(group.key);
+		const tools = expanded ? group.tools : group.tools.slice(0, COLLAPSED_PREVIEW_COUNT);
 		return {
 			key: group.key,
 			label: group.label,
@@ -823,22 +501,43 @@ class tokenCounteViewProvider implements vscode.WebviewViewProvider {
 			classification: group.classification,
 			tokenCount: group.tokenCount,
 			toolCount: group.tools.length,
-			tools: group.tools.map(t => ({
+			tools: tools.map(t => ({
 				shortName: t.shortName,
 				description: t.description,
 				tokenCount: t.tokenCount
 			})),
-			expanded: this._expandedGroups.has(group.key)
+			expanded
 		};
 	}
 }
 
 type ToolGroupClassification = 'mcp' | 'extension' | 'builtin' | 'unknown';
 
+// Number of tool chips shown for a collapsed group
+const COLLAPSED_PREVIEW_COUNT = 3;
+
+// Sort rank per classification, looked up directly by the group comparator
+const CLASSIFICATION_ORDER: Readonly<Record<ToolGroupClassification, number>> = {
+	mcp: 0,
+	extension: 1,
+	builtin: 2,
+	unknown: 3
+};
+
+// Tag keys that name their source directly, e.g. "server:github" or "ext:copilot"
+const TAG_KEY_CLASSIFICATIONS: ReadonlyMap<string, ToolGroupClassification> = new Map<string, ToolGroupClassification>([
+	['server', 'mcp'],
+	['mcp', 'mcp'],
+	['extension', 'extension'],
+	['ext', 'extension']
+]);
+
 type ToolGroup = ToolGroupInfo & {
 	tools: EnrichedTool[];
 	tokenCount: number;
 	key: string;
+	// Lowercased label and id, matched against the filter term
+	searchText: string;
 };
 
 type ToolGroupInfo = {
@@ -847,12 +546,411 @@ type ToolGroupInfo = {
 	classification: ToolGroupClassification;
 };
 
+// Only the fields the view renders; the full tool info (incl. inputSchema) is not retained
 type EnrichedTool = {
-	info: vscode.LanguageModelToolInformation;
 	tokenCount: number;
 	shortName: string;
 	description: string;
+	// Lowercased short name and description, matched against the filter term
+	searchText: string;
 };
 
+// Static parts of the webview document, built once instead of on every render
+const WEBVIEW_STYLES = `
+	body {
+		padding: 10px;
+		margin: 0;
+		font-family: var(--vscode-font-family);
+		font-size: var(--vscode-font-size);
+		color: var(--vscode-foreground);
+		background-color: var(--vscode-editor-background);
+	}
+	.summary {
+		display: flex;
+		gap: 12px;
+		font-size: 12px;
+		color: var(--vscode-descriptionForeground);
+		margin-bottom: 12px;
+		flex-wrap: wrap;
+	}
+	.filter-indicator {
+		color: var(--vscode-textLink-foreground);
+	}
+	.header {
+		display: flex;
+		align-items: center;
+		justify-content: space-between;
+		margin-bottom: 16px;
+		padding-bottom: 10px;
+		border-bottom: 1px solid var(--vscode-panel-border);
+	}
+	h2 {
+		margin: 0;
+		color: var(--vscode-foreground);
+		font-size: 14px;
+		font-weight: 600;
+		letter-spacing: 0.3px;
+		text-transform: uppercase;
+	}
+	.refresh-btn {
+		background: transparent;
+		color: var(--vscode-foreground);
+		border: 1px solid var(--vscode-panel-border);
+		padding: 4px 8px;
+		cursor: pointer;
+		border-radius: 3px;
+		font-size: 11px;
+		display: flex;
+		align-items: center;
+		gap: 4px;
+		transition: all 0.2s;
+	}
+	.refresh-btn:hover {
+		background: var(--vscode-list-hoverBackground);
+		border-color: var(--vscode-focusBorder);
+	}
+	.refresh-icon {
+		font-size: 12px;
+	}
+	.server {
+		margin-bottom: 12px;
+		border: 1px solid var(--vscode-panel-border);
+		border-radius: 4px;
+		padding: 14px;
+		background: var(--vscode-editor-background);
+		transition: background 0.2s;
+	}
+	.server:hover {
+		background: var(--vscode-list-hoverBackground);
+	}
+	.server-header {
+		display: flex;
+		justify-content: space-between;
+		align-items: flex-start;
+		margin-bottom: 8px;
+	}
+	.server-name {
+		color: var(--vscode-textLink-foreground);
+		font-size: 15px;
+		font-weight: 600;
+	}
+	.server-id {
+		font-size: 11px;
+		color: var(--vscode-descriptionForeground);
+	}
+	.server-stats {
+		display: flex;
+		gap: 15px;
+		flex-wrap: wrap;
+	}
+	.stat {
+		color: var(--vscode-descriptionForeground);
+		font-size: 13px;
+		background: var(--vscode-editorWidget-background);
+		padding: 4px 8px;
+		border-radius: 3px;
+	}
+	.badge {
+		font-size: 11px;
+		padding: 2px 8px;
+		border-radius: 999px;
+		text-transform: uppercase;
+		letter-spacing: 0.3px;
+		border: 1px solid var(--vscode-panel-border);
+		color: var(--vscode-descriptionForeground);
+	}
+	.badge.mcp {
+		color: var(--vscode-testing-iconPassed);
+		border-color: var(--vscode-testing-iconPassed);
+	}
+	.badge.extension {
+		color: var(--vscode-focusBorder);
+		border-color: var(--vscode-focusBorder);
+	}
+	.badge.builtin {
+		color: var(--vscode-descriptionForeground);
+	}
+	.tool-list {
+		margin-top: 10px;
+		display: flex;
+		flex-direction: column;
+		gap: 8px;
+	}
+	.tool-list--collapsed {
+		gap: 6px;
+	}
+	.tool-preview {
+		display: flex;
+		flex-wrap: wrap;
+		gap: 6px;
+		font-size: 12px;
+		color: var(--vscode-descriptionForeground);
+	}
+	.tool-chip {
+		background: var(--vscode-editorWidget-background);
+		border-radius: 999px;
+		padding: 2px 8px;
+		font-size: 11px;
+		color: var(--vscode-descriptionForeground);
+	}
+	.tool-row {
+		display: flex;
+		justify-content: space-between;
+		gap: 12px;
+		padding-bottom: 6px;
+		border-bottom: 1px solid var(--vscode-panel-border);
+	}
+	.tool-row:last-child {
+		border-bottom: none;
+		padding-bottom: 0;
+	}
+	.tool-name {
+		font-weight: 600;
+	}
+	.tool-description {
+		font-size: 12px;
+		color: var(--vscode-descriptionForeground);
+	}
+	.tool-meta {
+		font-size: 12px;
+		color: var(--vscode-descriptionForeground);
+		white-space: nowrap;
+	}
+	.tool-extra {
+		text-align: right;
+		font-size: 12px;
+		color: var(--vscode-descriptionForeground);
+	}
+	.link-button {
+		background: none;
+		border: none;
+		color: var(--vscode-textLink-foreground);
+		cursor: pointer;
+		font-size: 12px;
+		padding: 0;
+		text-decoration: underline;
+	}
+	.link-button:focus {
+		outline: 1px solid var(--vscode-focusBorder);
+	}
+	.no-tools {
+		color: var(--vscode-descriptionForeground);
+		font-style: italic;
+		text-align: center;
+		padding: 20px;
+	}
+	.filter-bar {
+		display: flex;
+		gap: 8px;
+		margin-bottom: 12px;
+	}
+	.filter-input {
+		flex: 1;
+		padding: 6px 8px;
+		border-radius: 4px;
+		border: 1px solid var(--vscode-panel-border);
+		background: var(--vscode-input-background);
+		color: var(--vscode-input-foreground);
+	}
+	.clear-filter {
+		border: none;
+		background: var(--vscode-button-secondaryBackground);
+		color: var(--vscode-button-secondaryForeground);
+		padding: 6px 10px;
+		border-radius: 4px;
+		cursor: pointer;
+	}
+	.clear-filter:hover {
+		background: var(--vscode-button-secondaryHoverBackground);
+	}
+`;
+
+const WEBVIEW_SCRIPT = `
+	const vscode = acquireVsCodeApi();
+	// Coalesce keystrokes so the extension only re-filters once typing pauses
+	const FILTER_DEBOUNCE_MS = 150;
+	let filterTimer;
+	let pendingFilter;
+	function postFilter(value) {
+		clearTimeout(filterTimer);
+		pendingFilter = undefined;
+		vscode.postMessage({ command: 'filter', value });
+	}
+	function refresh() {
+		// Apply a pending keystroke first so the refreshed view matches the input
+		if (pendingFilter !== undefined) {
+			postFilter(pendingFilter);
+		}
+		vscode.postMessage({ command: 'refresh' });
+	}
+	function toggleGroup(key, expanded) {
+		vscode.postMessage({ command: expanded ? 'collapse' : 'expand', key });
+	}
+	function onFilterChange(event) {
+		const value = event.target.value || '';
+		// Emptying the box (backspace or the native clear button) applies immediately
+		if (value === '') {
+			postFilter(value);
+			return;
+		}
+		clearTimeout(filterTimer);
+		pendingFilter = value;
+		filterTimer = setTimeout(() => postFilter(value), FILTER_DEBOUNCE_MS);
+	}
+	function clearFilter() {
+		postFilter('');
+	}
+	document.addEventListener('click', (event) => {
+		const target = event.target;
+		if (target && target instanceof HTMLElement && target.dataset.action === 'toggle-tools') {
+			const key = target.dataset.key;
+			if (key) {
+				const expanded = target.dataset.state === 'expanded';
+				toggleGroup(key, expanded);
+			}
+		}
+	});
+	function escapeHtml(unsafe) {
+		return unsafe
+			.replace(/&/g, "&amp;")
+			.replace(/</g, "&lt;")
+			.replace(/>/g, "&gt;")
+			.replace(/"/g, "&quot;")
+			.replace(/'/g, "&#039;");
+	}
+
+	function renderClassificationLabel(kind) {
+		switch (kind) {
+			case 'mcp': return 'MCP Server';
+			case 'extension': return 'Extension Tool';
+			case 'builtin': return 'Built-In';
+			default: return 'Tool Source';
+		}
+	}
+
+	function renderToolList(group) {
+		if (group.tools.length === 0) {
+			return '<div class="tool-list"><p class="no-tools">No tools registered.</p></div>';
+		}
+
+		if (!group.expanded) {
+			const preview = group.tools.slice(0, ${COLLAPSED_PREVIEW_COUNT}).map(tool => 
+				'<span class="tool-chip">' + escapeHtml(tool.shortName) + '</span>'
+			).join('');
+			return '<div class="tool-list tool-list--collapsed">' +
+				'<div class="tool-preview">' + (preview || 'Tools unavailable') + '</div>' +
+				'<button class="link-button" data-action="toggle-tools" data-state="collapsed" data-key="' + group.key + '">' +
+				'View all ' + group.toolCount + ' tool' + (group.toolCount !== 1 ? 's' : '') + '</button></div>';
+		}
+
+		const preview = group.tools.map(tool => 
+			'<div class="tool-row">' +
+			'<div><div class="tool-name">' + escapeHtml(tool.shortName) + '</div>' +
+			'<div class="tool-description">' + escapeHtml(tool.description || 'No description provided') + '</div></div>' +
+			'<span class="tool-meta">' + tool.tokenCount.toLocaleString() + ' tokens</span></div>'
+		).join('');
+
+		const footer = '<div class="tool-extra">' +
+			'<button class="link-button" data-action="toggle-tools" data-state="expanded" data-key="' + group.key + '">Show less</button></div>';
+
+		return '<div class="tool-list">' + preview + footer + '</div>';
+	}
+
+	function updateContentWithoutReload(data) {
+		const { groups, totals, overallTotals, isFiltered } = data;
+		const filterInput = document.querySelector('.filter-input');
+		const filterValue = filterInput ? filterInput.value : '';
+		
+		const sourceSummary = isFiltered
+			? totals.servers + '/' + overallTotals.servers + ' sources'
+			: totals.servers + ' ' + (totals.servers === 1 ? 'source' : 'sources');
+		const toolSummary = isFiltered
+			? totals.tools + '/' + overallTotals.tools + ' tools'
+			: totals.tools + ' total tools';
+		const tokenSummary = isFiltered
+			? totals.tokens.toLocaleString() + '/' + overallTotals.tokens.toLocaleString() + ' tokens'
+			: totals.tokens.toLocaleString() + ' tokens across all descriptions';
+		const filterIndicator = isFiltered ? '<span class="filter-indicator">Filter: "' + escapeHtml(filterValue) + '"</span>' : '';
+
+		const summary = document.querySelector('.summary');
+		if (summary) {
+			summary.innerHTML = 
+				'<span>🧩 ' + sourceSummary + '</span>' +
+				'<span>🔧 ' + toolSummary + '</span>' +
+				'<span>🎫 ' + tokenSummary + '</span>' +
+				filterIndicator;
+		}
+
+		const filterBar = document.querySelector('.filter-bar');
+		if (filterBar) {
+			const clearBtn = filterBar.querySelector('.clear-filter');
+			if (isFiltered && !clearBtn) {
+				const btn = document.createElement('button');
+				btn.className = 'clear-filter';
+				btn.textContent = 'Clear';
+				btn.onclick = clearFilter;
+				filterBar.appendChild(btn);
+			} else if (!isFiltered && clearBtn) {
+				clearBtn.remove();
+			}
+		}
+
+		const serversEl = document.querySelector('.servers');
+		if (!serversEl) return;
+
+		let serversHtml = '';
+		if (groups.length === 0) {
+			const message = isFiltered
+				? 'No MCP servers or tools match your filter.'
+				: 'No MCP servers or tools found.';
+			serversHtml = '<p class="no-tools">' + message + '</p>';
+		} else {
+			for (const group of groups) {
+				serversHtml += 
+					'<div class="server ' + group.classification + '" data-group="' + group.key + '">' +
+					'<div class="server-header"><div>' +
+					'<div class="server-name">📦 ' + escapeHtml(group.label) + '</div>' +
+					(group.id && group.id !== group.label ? '<div class="server-id">' + escapeHtml(group.id) + '</div>' : '') +
+					'</div>' +
+					'<span class="badge ' + group.classification + '">' + renderClassificationLabel(group.classification) + '</span>' +
+					'</div>' +
+					'<div class="server-stats">' +
+					'<span class="stat">🔧 ' + group.toolCount + ' tool' + (group.toolCount !== 1 ? 's' : '') + '</span>' +
+					'<span class="stat">🎫 ' + group.tokenCount.toLocaleString() + ' tokens</span>' +
+					'</div>' +
+					renderToolList(group) +
+					'</div>';
+			}
+		}
+
+		// Swap the whole list in a single DOM write
+		serversEl.innerHTML = serversHtml;
+	}
+
+	window.addEventListener('message', (event) => {
+		const message = event.data;
+		if (!message || typeof message !== 'object') {
+			return;
+		}
+		if (message.command === 'updateTools') {
+			const section = document.querySelector('.server[data-group="' + message.key + '"]');
+			if (!section) {
+				return;
+			}
+			const list = section.querySelector('.tool-list');
+			if (!list) {
+				return;
+			}
+			list.innerHTML = message.html;
+		} else if (message.command === 'updateContent') {
+			updateContentWithoutReload(message);
+		}
+	});
+`;
+
 // This method is called when your extension is deactivated
-export function deactivate() {}
+export function deactivate() {
+	// The encoder lives in WASM memory, which is not garbage collected
+	sharedEncoding?.free();
+	sharedEncoding = undefined;
+}